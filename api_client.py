@@ -18,6 +18,32 @@ class SignalStackClient:
         self.max_retries = MAX_RETRIES
         self.retry_delay = RETRY_DELAY
         self.state_manager = StateManager()
+        # Shared across requests so retries and later calls reuse the connection pool;
+        # opened at app startup and closed at shutdown
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def open(self):
+        """
+        Create the shared HTTP client
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, failing if it is not open
+        """
+        if self._client is None or self._client.is_closed:
+            raise RuntimeError("SignalStackClient is not open")
+        return self._client
+
+    async def aclose(self):
+        """
+        Close the shared HTTP client
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _make_request(self, payload: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -28,32 +54,33 @@ class SignalStackClient:
         
         retry_count = 0
         while retry_count <= self.max_retries:
+            # Outside the try so a closed client fails loudly instead of being retried
+            client = self._get_client()
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        self.webhook_url,
-                        json=payload,
-                        timeout=self.timeout
-                    )
-                    
-                    response_data = response.json()
-                    logger.info(f"API response: {response_data}")
-                    
-                    # Log the API call in the state manager
-                    self.state_manager.add_api_call(payload, response_data)
-                    
-                    # Check for successful response
-                    if 'status' in response_data:
-                        if response_data['status'] in ['filled', 'accepted']:
-                            return True, response_data
-                        elif response_data['status'] == 'ValidationError':
-                            logger.error(f"Validation error: {response_data.get('message', 'Unknown error')}")
-                            return False, response_data
-                    
-                    # If we get here, the response was not successful but also not a validation error
-                    logger.warning(f"Unexpected response format: {response_data}")
-                    retry_count += 1
-                    
+                response = await client.post(
+                    self.webhook_url,
+                    json=payload,
+                    timeout=self.timeout
+                )
+                
+                response_data = response.json()
+                logger.info(f"API response: {response_data}")
+                
+                # Log the API call in the state manager
+                self.state_manager.add_api_call(payload, response_data)
+                
+                # Check for successful response
+                if 'status' in response_data:
+                    if response_data['status'] in ['filled', 'accepted']:
+                        return True, response_data
+                    elif response_data['status'] == 'ValidationError':
+                        logger.error(f"Validation error: {response_data.get('message', 'Unknown error')}")
+                        return False, response_data
+                
+                # If we get here, the response was not successful but also not a validation error
+                logger.warning(f"Unexpected response format: {response_data}")
+                retry_count += 1
+                
             except (httpx.TimeoutException, httpx.ConnectError) as e:
                 logger.error(f"API request failed (attempt {retry_count+1}/{self.max_retries+1}): {str(e)}")
                 retry_count += 1
@@ -21,5 +21,8 @@ BUY_RETRY_REDUCTION_PERCENT = float(os.getenv("BUY_RETRY_REDUCTION_PERCENT", "2"
 MAX_BUY_RETRIES = int(os.getenv("MAX_BUY_RETRIES", "3"))
 COOLDOWN_PERIOD_HOURS = int(os.getenv("COOLDOWN_PERIOD_HOURS", "12"))
 
+# Shutdown settings
+SHUTDOWN_DRAIN_TIMEOUT = int(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", "300"))  # seconds to wait for in-flight signals
+
 # Dashboard settings
 DASHBOARD_PORT = int(os.getenv("DASHBOARD_PORT", "8000"))
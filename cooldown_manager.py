@@ -34,12 +34,11 @@ class CooldownManager:
         end_time = self.state_manager.cooldown_end_time
         remaining = end_time - now
         
-        hours = int(remaining.total_seconds() // 3600)
-        minutes = int((remaining.total_seconds() % 3600) // 60)
+        hours, minutes = divmod(int(remaining.total_seconds() // 60), 60)
         
         return {
             "active": True,
-            "end_time": end_time.isoformat(),
+            "end_time": self.state_manager.cooldown_end_time_iso,
             "remaining": {
                 "hours": hours,
                 "minutes": minutes
@@ -11,7 +11,7 @@ from fastapi.templating import Jinja2Templates
 import uvicorn
 from typing import Optional, List
 
-from config import DASHBOARD_PORT, get_available_users, user_exists, get_users_from_environment
+from config import DASHBOARD_PORT, SHUTDOWN_DRAIN_TIMEOUT, get_available_users, user_exists, get_users_from_environment
 from strategy_repository import StrategyRepository
 from signal_processor import SignalProcessor
 from cash_manager import CashManager
@@ -35,9 +35,34 @@ signal_processor = SignalProcessor()
 cash_manager = CashManager()
 cooldown_manager = CooldownManager()
 
+# Strong references to in-flight webhook signal tasks (the loop only keeps weak ones)
+_signal_tasks = set()
+
+def _spawn_signal_task(coro):
+    """Schedule signal processing directly on the running event loop"""
+    task = asyncio.create_task(coro)
+    _signal_tasks.add(task)
+    task.add_done_callback(_signal_tasks.discard)
+    return task
+
+async def _drain_signal_tasks():
+    """Wait for in-flight webhook signal tasks so trade sequences aren't cut off at shutdown"""
+    if not _signal_tasks:
+        return
+    
+    logger.info(f"🔥 SYSTEM SHUTDOWN: waiting for {len(_signal_tasks)} in-flight signal tasks timeout={SHUTDOWN_DRAIN_TIMEOUT}s")
+    done, pending = await asyncio.wait(set(_signal_tasks), timeout=SHUTDOWN_DRAIN_TIMEOUT)
+    
+    if pending:
+        logger.warning(f"🔥 SYSTEM SHUTDOWN: abandoning {len(pending)} signal tasks still running after {SHUTDOWN_DRAIN_TIMEOUT}s")
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
 @asynccontextmanager
 async def lifespan(app):
     # Startup event
+    signal_processor.api_client.open()
     available_users = get_available_users()
     logger.info(f"🔥 SYSTEM STARTUP: Multi-User Trading Webhook Service (Dynamic Multi-Symbol)")
     logger.info(f"🔥 AVAILABLE USERS: {', '.join(available_users) if available_users else 'None configured'}")
@@ -45,6 +70,8 @@ async def lifespan(app):
     logger.info(f"🔥 SELLING ORDER: Symbols sold in reverse URL order (last symbol in URL gets sold first)")
     yield
     # Shutdown event
+    await _drain_signal_tasks()
+    await signal_processor.api_client.aclose()
     logger.info("🔥 SYSTEM SHUTDOWN: Multi-User Trading Webhook Service")
 
 # Initialize FastAPI
@@ -62,22 +89,20 @@ async def webhook_user_multi_symbol(
     username: str, 
     strategy_name: str, 
     symbols: str, 
-    request: Request, 
-    background_tasks: BackgroundTasks
+    request: Request
 ):
     """User-specific webhook for buy/sell operations with multiple symbols"""
-    return await _process_user_multi_symbol_webhook(username, strategy_name, symbols, request, background_tasks)
+    return await _process_user_multi_symbol_webhook(username, strategy_name, symbols, request)
 
 # Broadcast webhooks - buy/sell operations with variable sell symbols
 @app.post("/cast/{strategy_name}/{symbols:path}")
 async def webhook_broadcast_multi_symbol(
     strategy_name: str, 
     symbols: str, 
-    request: Request, 
-    background_tasks: BackgroundTasks
+    request: Request
 ):
     """Broadcast webhook for buy/sell operations with multiple symbols"""
-    return await _process_broadcast_multi_symbol_webhook(strategy_name, symbols, request, background_tasks)
+    return await _process_broadcast_multi_symbol_webhook(strategy_name, symbols, request)
 
 def _parse_symbol_path(symbols: str) -> tuple:
     """
@@ -97,7 +122,7 @@ def _parse_symbol_path(symbols: str) -> tuple:
         return None, []
     
     # First symbol is buy_symbol
-    buy_symbol = symbol_parts[0] if symbol_parts[0].upper() != "NONE" else None
+    buy_symbol = symbol_parts[0] if symbol_parts[0] != "NONE" else None
     
     # Rest are sell symbols - reverse them for execution order
     sell_symbols = symbol_parts[1:] if len(symbol_parts) > 1 else []
@@ -105,7 +130,7 @@ def _parse_symbol_path(symbols: str) -> tuple:
     
     return buy_symbol, sell_symbols_reversed
 
-async def _process_user_multi_symbol_webhook(username: str, strategy_name: str, symbols: str, request: Request, background_tasks: BackgroundTasks):
+async def _process_user_multi_symbol_webhook(username: str, strategy_name: str, symbols: str, request: Request):
     """Process multi-symbol webhook signal for a specific user's strategy"""
     try:
         client_ip = request.client.host if request.client else "unknown"
@@ -155,7 +180,7 @@ async def _process_user_multi_symbol_webhook(username: str, strategy_name: str,
         logger.info(f"🔥 USER OPERATIONS: buy={buy_symbol} sell_sequence={sell_symbols}")
         
         # Process signal in background to avoid webhook timeout
-        background_tasks.add_task(signal_processor.process_multi_symbol_signal, buy_symbol, sell_symbols, strategy)
+        _spawn_signal_task(signal_processor.process_multi_symbol_signal(buy_symbol, sell_symbols, strategy))
         
         return {
             "status": "processing", 
@@ -179,7 +204,7 @@ async def _process_user_multi_symbol_webhook(username: str, strategy_name: str,
             }
         )
 
-async def _process_broadcast_multi_symbol_webhook(strategy_name: str, symbols: str, request: Request, background_tasks: BackgroundTasks):
+async def _process_broadcast_multi_symbol_webhook(strategy_name: str, symbols: str, request: Request):
     """Process multi-symbol webhook signal for all users with the same strategy name"""
     try:
         client_ip = request.client.host if request.client else "unknown"
@@ -220,7 +245,7 @@ async def _process_broadcast_multi_symbol_webhook(strategy_name: str, symbols: s
         logger.info(f"🔥 BROADCAST OPERATIONS: buy={buy_symbol} sell_sequence={sell_symbols}")
         
         # Process signals in parallel for all matching strategies
-        background_tasks.add_task(_process_broadcast_multi_symbol_signals_parallel, buy_symbol, sell_symbols, strategies)
+        _spawn_signal_task(_process_broadcast_multi_symbol_signals_parallel(buy_symbol, sell_symbols, strategies))
         
         return {
             "status": "processing", 
@@ -732,7 +757,7 @@ async def get_user_strategy_logs(username: str, strategy_name: str, skip: int =
             raise HTTPException(status_code=404, detail=f"Strategy '{strategy_name}' not found for user '{username}'")
         
         # Get all API calls for this strategy
-        all_logs = getattr(strategy, 'api_calls', [])
+        all_logs = strategy.api_calls
         total_count = len(all_logs)
         
         # Apply pagination (skip from the end since we want most recent first)
@@ -304,6 +304,13 @@ class SignalProcessor:
         """
         logger.info(f"🔥 LEGACY BUYING SHARES: strategy={strategy.name} owner={strategy.owner} symbol={symbol} attempting_purchase_with_retry")
         
+        # Skip the price-discovery buy when there is no cash to spend
+        available_cash = strategy.cash_balance
+        
+        if available_cash <= 5:  # Minimum cash check
+            logger.info(f"🔥 LEGACY BUYING SHARES: strategy={strategy.name} owner={strategy.owner} symbol={symbol} insufficient_cash={available_cash}")
+            return
+        
         # 1. Buy 1 share to get current price
         success, price, response = await self.api_client.buy_symbol(symbol, 1, strategy)
         
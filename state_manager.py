@@ -1,4 +1,5 @@
 # state_manager.py - In-memory state management
+from collections import deque
 from datetime import datetime, timedelta
 import threading
 import logging
@@ -10,10 +11,16 @@ class StateManager:
     _lock = threading.Lock()
 
     def __new__(cls):
+        # Fast path: once created, return the instance without taking the lock
+        if cls._instance is not None:
+            return cls._instance
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super(StateManager, cls).__new__(cls)
-                cls._instance._initialize()
+                # Fully initialize before publishing so the unlocked fast path
+                # never sees a half-built instance
+                instance = super(StateManager, cls).__new__(cls)
+                instance._initialize()
+                cls._instance = instance
             return cls._instance
 
     def _initialize(self):
@@ -21,9 +28,12 @@ class StateManager:
         self.cash_balance = 0.0
         self.cash_balance_source = "system"
         self.cash_balance_updated_at = datetime.now()
+        self.cash_balance_updated_at_iso = self.cash_balance_updated_at.isoformat()
         self.in_cooldown = False
         self.cooldown_end_time = None
-        self.api_calls = []
+        self.cooldown_end_time_iso = None
+        # Keep only the last 100 API calls; deque drops the oldest in O(1)
+        self.api_calls = deque(maxlen=100)
         self.is_processing = False
 
     def update_cash_balance(self, amount, source="system"):
@@ -32,25 +42,25 @@ class StateManager:
             self.cash_balance = amount
             self.cash_balance_source = source
             self.cash_balance_updated_at = datetime.now()
+            self.cash_balance_updated_at_iso = self.cash_balance_updated_at.isoformat()
             logger.info(f"Cash balance updated to {amount} ({source})")
 
     def get_cash_balance_info(self):
         """Get information about the current cash balance"""
         with self._lock:
             staleness = datetime.now() - self.cash_balance_updated_at
-            minutes = staleness.total_seconds() // 60
-            hours = minutes // 60
-            days = hours // 24
+            hours, minutes = divmod(int(staleness.total_seconds() // 60), 60)
+            days, hours = divmod(hours, 24)
             
             return {
                 "balance": self.cash_balance,
                 "source": self.cash_balance_source,
                 "staleness": {
-                    "minutes": int(minutes % 60),
-                    "hours": int(hours % 24),
-                    "days": int(days)
+                    "minutes": minutes,
+                    "hours": hours,
+                    "days": days
                 },
-                "updated_at": self.cash_balance_updated_at.isoformat()
+                "updated_at": self.cash_balance_updated_at_iso
             }
 
     def start_cooldown(self, duration_hours):
@@ -58,6 +68,7 @@ class StateManager:
         with self._lock:
             self.in_cooldown = True
             self.cooldown_end_time = datetime.now() + timedelta(hours=duration_hours)
+            self.cooldown_end_time_iso = self.cooldown_end_time.isoformat()
             logger.info(f"Cooldown started, will end at {self.cooldown_end_time}")
 
     def check_cooldown(self):
@@ -84,14 +95,13 @@ class StateManager:
                 "response": response,
                 "timestamp": timestamp.isoformat()
             })
-            # Keep only the last 100 API calls
-            if len(self.api_calls) > 100:
-                self.api_calls.pop(0)
 
+    # Read-only accessors below skip the lock: copying the history or reading a
+    # single attribute is atomic under the CPython GIL, so concurrent
+    # dashboard reads don't serialize behind each other. Writers keep the lock.
     def get_api_calls(self):
         """Get the history of API calls"""
-        with self._lock:
-            return list(self.api_calls)
+        return list(self.api_calls)
 
     def set_processing(self, status):
         """Set the processing status"""
@@ -100,5 +110,4 @@ class StateManager:
 
     def is_currently_processing(self):
         """Check if we're currently processing a signal"""
-        with self._lock:
-            return self.is_processing
+        return self.is_processing